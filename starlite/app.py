@@ -1,14 +1,10 @@
-from typing import Any, Dict, List, Optional, Set, Union, cast
+from inspect import isclass
+from typing import Dict, List, Optional, Set, Union, cast
 
 from openapi_schema_pydantic.util import construct_open_api_with_schema_class
 from openapi_schema_pydantic.v3.v3_1_0.open_api import OpenAPI
-from pydantic import validate_arguments
 from pydantic.typing import AnyCallable
 from starlette.middleware import Middleware as StarletteMiddleware
-from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.gzip import GZipMiddleware
-from starlette.middleware.trustedhost import TrustedHostMiddleware
-from starlette.staticfiles import StaticFiles
 from starlette.types import ASGIApp, Receive, Scope, Send
 from typing_extensions import Type
 
@@ -32,6 +28,7 @@ from starlite.openapi.path_item import create_path_item
 from starlite.plugins.base import PluginProtocol
 from starlite.provide import Provide
 from starlite.response import Response
+from starlite.route_map import RouteMap
 from starlite.router import Router
 from starlite.routes import ASGIRoute, BaseRoute, HTTPRoute, WebSocketRoute
 from starlite.signature import SignatureModelFactory
@@ -62,7 +59,6 @@ class Starlite(Router):
         "debug",
         "gzip_config",
         "openapi_schema",
-        "plain_routes",
         "plugins",
         "route_map",
         "state",
@@ -70,7 +66,6 @@ class Starlite(Router):
         "template_engine",
     )
 
-    @validate_arguments(config={"arbitrary_types_allowed": True})
     def __init__(
         self,
         *,
@@ -95,17 +90,26 @@ class Starlite(Router):
         static_files_config: Optional[Union[StaticFilesConfig, List[StaticFilesConfig]]] = None,
         template_config: Optional[TemplateConfig] = None,
     ):
+        # the arguments are not validated using pydantic, since most of them are arbitrary types that are validated
+        # by the Router or by the config models themselves - we only check the values that would otherwise fail late
+        if allowed_hosts and not all(isinstance(host, str) for host in allowed_hosts):
+            raise ImproperlyConfiguredException("allowed_hosts must be a list of strings")
+        if exception_handlers and not all(
+            isinstance(key, int) or (isclass(key) and issubclass(key, Exception)) for key in exception_handlers
+        ):
+            raise ImproperlyConfiguredException(
+                "exception_handlers keys must be either status codes or exception classes"
+            )
         self.allowed_hosts = allowed_hosts
         self.cache_config = cache_config
         self.cors_config = cors_config
         self.debug = debug
         self.gzip_config = gzip_config
-        self.plain_routes: Set[str] = set()
         self.plugins = plugins or []
-        self.route_map: Dict[str, Any] = {}
+        self.route_map = RouteMap(app=self)
         self.routes: List[BaseRoute] = []
         self.state = State()
-        self.static_paths = set()
+        self.static_paths: Set[str] = set()
 
         super().__init__(
             dependencies=dependencies,
@@ -127,6 +131,10 @@ class Starlite(Router):
             self.openapi_schema = self.create_openapi_schema_model(openapi_config=openapi_config)
             self.register(openapi_config.openapi_controller)
         if static_files_config:
+            from starlette.staticfiles import (  # pylint: disable=import-outside-toplevel
+                StaticFiles,
+            )
+
             for config in static_files_config if isinstance(static_files_config, list) else [static_files_config]:
                 path = normalize_path(config.path)
                 self.static_paths.add(path)
@@ -140,13 +148,27 @@ class Starlite(Router):
         Creates an ASGIApp that wraps the ASGI router inside an exception handler.
 
         If CORS or TruseedHost configs are provided to the constructor, they will wrap the router as well.
+
+        The middlewares are imported only when configured, since each pulls in modules most apps never use.
         """
         asgi_handler: ASGIApp = self.asgi_router
         if self.gzip_config:
+            from starlette.middleware.gzip import (  # pylint: disable=import-outside-toplevel
+                GZipMiddleware,
+            )
+
             asgi_handler = GZipMiddleware(app=asgi_handler, **self.gzip_config.dict())
         if self.allowed_hosts:
+            from starlette.middleware.trustedhost import (  # pylint: disable=import-outside-toplevel
+                TrustedHostMiddleware,
+            )
+
             asgi_handler = TrustedHostMiddleware(app=asgi_handler, allowed_hosts=self.allowed_hosts)
         if self.cors_config:
+            from starlette.middleware.cors import (  # pylint: disable=import-outside-toplevel
+                CORSMiddleware,
+            )
+
             asgi_handler = CORSMiddleware(app=asgi_handler, **self.cors_config.dict())
         return self.wrap_in_exception_handler(
             asgi_handler,
@@ -174,56 +196,6 @@ class Starlite(Router):
 
         return ExceptionHandlerMiddleware(app=app, exception_handlers=exception_handlers, debug=self.debug)
 
-    def construct_route_map(self) -> None:  # noqa: C901 # pylint: disable=R0912
-        """
-        Create a map of the app's routes. This map is used in the asgi router to route requests.
-
-        """
-        seen_param_paths = set()
-        if "_components" not in self.route_map:
-            self.route_map["_components"] = set()
-        for route in self.routes:
-            path = route.path
-            if route.path_parameters or path in self.static_paths:
-                for param_definition in route.path_parameters:
-                    path = path.replace(param_definition["full"], "")
-                path = path.replace("{}", "*")
-                if path in seen_param_paths:
-                    raise ImproperlyConfiguredException("Should not use routes with conflicting path parameters")
-                seen_param_paths.add(path)
-                cur = self.route_map
-                components = ["/", *[component for component in path.split("/") if component]]
-                for component in components:
-                    components_set = cast(Set[str], cur["_components"])
-                    components_set.add(component)
-                    if component not in cur:
-                        cur[component] = {"_components": set()}
-                    cur = cast(Dict[str, Any], cur[component])
-            else:
-                if path not in self.route_map:
-                    self.route_map[path] = {"_components": set()}
-                self.plain_routes.add(path)
-                cur = self.route_map[path]
-            if "_path_parameters" not in cur:
-                cur["_path_parameters"] = route.path_parameters
-            if "_asgi_handlers" not in cur:
-                cur["_asgi_handlers"] = {}
-            if "_is_asgi" not in cur:
-                cur["_is_asgi"] = False
-            if path in self.static_paths:
-                cur["static_path"] = path
-                cur["_is_asgi"] = True
-            asgi_handlers = cast(Dict[str, ASGIApp], cur["_asgi_handlers"])
-            if isinstance(route, HTTPRoute):
-                for method, handler_mapping in route.route_handler_map.items():
-                    handler, _ = handler_mapping
-                    asgi_handlers[method] = self.build_route_middleware_stack(route, handler)
-            elif isinstance(route, WebSocketRoute):
-                asgi_handlers["websocket"] = self.build_route_middleware_stack(route, route.route_handler)
-            elif isinstance(route, ASGIRoute):
-                asgi_handlers["asgi"] = self.build_route_middleware_stack(route, route.route_handler)
-                cur["_is_asgi"] = True
-
     def build_route_middleware_stack(
         self,
         route: Union[HTTPRoute, WebSocketRoute, ASGIRoute],
@@ -232,20 +204,23 @@ class Starlite(Router):
         """Constructs a middleware stack that serves as the point of entry for each route"""
 
         # we wrap the route.handle method in the ExceptionHandlerMiddleware
-        asgi_handler = self.wrap_in_exception_handler(
-            app=route.handle, exception_handlers=route_handler.resolve_exception_handlers()
-        )
+        exception_handlers = route_handler.resolve_exception_handlers()
+        asgi_handler = self.wrap_in_exception_handler(app=route.handle, exception_handlers=exception_handlers)
+
+        resolved_middleware = route_handler.resolve_middleware()
+        if not resolved_middleware and not exception_handlers:
+            # the outer layer handles exceptions raised by middleware or by the layered exception handlers themselves,
+            # without either it would only repeat the default handling of the inner layer
+            return asgi_handler
 
-        for middleware in route_handler.resolve_middleware():
+        for middleware in resolved_middleware:
             if isinstance(middleware, StarletteMiddleware):
                 asgi_handler = middleware.cls(app=asgi_handler, **middleware.options)
             else:
                 asgi_handler = middleware(app=asgi_handler)
 
         # we wrap the entire stack again in ExceptionHandlerMiddleware
-        return self.wrap_in_exception_handler(
-            app=asgi_handler, exception_handlers=route_handler.resolve_exception_handlers()
-        )
+        return self.wrap_in_exception_handler(app=asgi_handler, exception_handlers=exception_handlers)
 
     def register(self, value: ControllerRouterHandler) -> None:  # type: ignore[override]
         """
@@ -271,7 +246,7 @@ class Starlite(Router):
                 route.create_handler_map()
             elif isinstance(route, WebSocketRoute):
                 route.handler_parameter_model = route.create_handler_kwargs_model(route.route_handler)
-        self.construct_route_map()
+        self.route_map.add_routes(routes)
 
     def create_handler_signature_model(self, route_handler: BaseRouteHandler) -> None:
         """
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from openapi_schema_pydantic.v3.v3_1_0.open_api import OpenAPI
 from orjson import OPT_INDENT_2, dumps
 
@@ -6,6 +8,7 @@ from starlite.controller import Controller
 from starlite.enums import MediaType, OpenAPIMediaType
 from starlite.exceptions import ImproperlyConfiguredException
 from starlite.handlers import get
+from starlite.response import render_openapi_schema
 
 
 class OpenAPIController(Controller):
@@ -15,6 +18,9 @@ class OpenAPIController(Controller):
     """
     redoc_version = "next"
     dumped_schema = ""
+    # the rendered schema bodies are cached after the first request, since the schema does not change at runtime
+    rendered_schema_yaml: Optional[bytes] = None
+    rendered_schema_json: Optional[bytes] = None
 
     @staticmethod
     def schema_from_request(request: Request) -> OpenAPI:
@@ -24,14 +30,22 @@ class OpenAPIController(Controller):
         return request.app.openapi_schema
 
     @get(path="/openapi.yaml", media_type=OpenAPIMediaType.OPENAPI_YAML, include_in_schema=False)
-    def retrieve_schema_yaml(self, request: Request) -> OpenAPI:
+    def retrieve_schema_yaml(self, request: Request) -> bytes:
         """Returns the openapi schema"""
-        return self.schema_from_request(request)
+        if self.rendered_schema_yaml is None:
+            self.rendered_schema_yaml = render_openapi_schema(
+                self.schema_from_request(request), media_type=OpenAPIMediaType.OPENAPI_YAML
+            )
+        return self.rendered_schema_yaml
 
     @get(path="/openapi.json", media_type=OpenAPIMediaType.OPENAPI_JSON, include_in_schema=False)
-    def retrieve_schema_json(self, request: Request) -> OpenAPI:
+    def retrieve_schema_json(self, request: Request) -> bytes:
         """Returns the openapi schema"""
-        return self.schema_from_request(request)
+        if self.rendered_schema_json is None:
+            self.rendered_schema_json = render_openapi_schema(
+                self.schema_from_request(request), media_type=OpenAPIMediaType.OPENAPI_JSON
+            )
+        return self.rendered_schema_json
 
     @get(media_type=MediaType.HTML, include_in_schema=False)
     def redoc(self, request: Request) -> str:  # pragma: no cover
@@ -7,7 +7,6 @@ from orjson import JSONDecodeError, loads
 from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from starlette.datastructures import FormData, UploadFile
 from starlette.requests import HTTPConnection
-from typing_extensions import Type
 
 from starlite.enums import RequestEncodingType
 from starlite.exceptions import ValidationException
@@ -51,23 +50,17 @@ def parse_query_params(connection: HTTPConnection) -> Dict[str, Any]:
     )
 
 
-def _path_param_reducer(acc: Dict[str, Union[str, List[str]]], cur: Tuple[Dict[str, Any], str]) -> Dict[str, Any]:
-    """
-    Reducer function - acc is a dictionary, cur is a tuple of a param definition object + raw string value
-    """
-    param_definition, raw_param = cur
-    param_name = cast(str, param_definition["name"])
-    param_type = cast(Type, param_definition["type"])
-    acc[param_name] = param_type(raw_param)
-    return acc
-
-
 def parse_path_params(path_parameters: List[Dict[str, Any]], raw_params: List[str]) -> Dict[str, Any]:
     """
     Parses raw path parameters by mapping them into a dictionary
+
+    We use a dict comprehension rather than reduce here, since it avoids a python function call per parameter.
     """
     try:
-        return reduce(_path_param_reducer, zip(path_parameters, raw_params), {})
+        return {
+            param_definition["name"]: param_definition["type"](raw_param)
+            for param_definition, raw_param in zip(path_parameters, raw_params)
+        }
     except (ValueError, TypeError, KeyError) as e:  # pragma: no cover
         raise ValidationException(f"unable to parse path parameters {str(raw_params)}") from e
 
@@ -12,6 +12,17 @@ from starlite.enums import MediaType, OpenAPIMediaType
 from starlite.exceptions import ImproperlyConfiguredException
 from starlite.template import TemplateEngineProtocol
 
+# plain string value of the json media type, for the exact str comparison fast path (see starlite.route_map)
+_JSON: str = MediaType.JSON.value
+
+
+def render_openapi_schema(schema: OpenAPI, media_type: Optional[str]) -> bytes:
+    """Renders the openapi schema into YAML if the media type is the OpenAPI YAML media type, otherwise into JSON"""
+    schema_dict = schema.dict(by_alias=True, exclude_none=True)
+    if media_type == OpenAPIMediaType.OPENAPI_YAML:
+        return cast(bytes, yaml.dump(schema_dict, default_flow_style=False).encode("utf-8"))
+    return dumps(schema_dict, option=OPT_INDENT_2 | OPT_OMIT_MICROSECONDS)
+
 
 class Response(StarletteResponse):
     def __init__(
@@ -47,14 +58,10 @@ class Response(StarletteResponse):
             return b""
 
         try:
-            if self.media_type == MediaType.JSON:
+            if self.media_type == _JSON:
                 return dumps(content, default=self.serializer, option=OPT_SERIALIZE_NUMPY | OPT_OMIT_MICROSECONDS)
             if isinstance(content, OpenAPI):
-                content_dict = content.dict(by_alias=True, exclude_none=True)
-                if self.media_type == OpenAPIMediaType.OPENAPI_YAML:
-                    encoded = yaml.dump(content_dict, default_flow_style=False).encode("utf-8")
-                    return cast(bytes, encoded)
-                return dumps(content_dict, option=OPT_INDENT_2 | OPT_OMIT_MICROSECONDS)
+                return render_openapi_schema(content, media_type=self.media_type)
             return super().render(content)
         except (AttributeError, ValueError, TypeError) as e:
             raise ImproperlyConfiguredException("Unable to serialize response content") from e
@@ -0,0 +1,276 @@
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+
+from starlette.types import ASGIApp, Scope
+
+from starlite.enums import HttpMethod, ScopeType
+from starlite.exceptions import (
+    ImproperlyConfiguredException,
+    MethodNotAllowedException,
+    NotFoundException,
+)
+from starlite.handlers import ASGIRouteHandler, HTTPRouteHandler, WebsocketRouteHandler
+from starlite.parsers import parse_path_params
+from starlite.routes import (
+    ASGIRoute,
+    BaseRoute,
+    HTTPRoute,
+    WebSocketRoute,
+    param_match_regex,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from starlite.app import Starlite
+
+# plain string values of the scope types - dict lookups and comparisons only take their fast path for exact str
+# instances, which the members of a str enum are not
+_ASGI: str = ScopeType.ASGI.value
+_HTTP: str = ScopeType.HTTP.value
+_WEBSOCKET: str = ScopeType.WEBSOCKET.value
+
+# a route and route handler whose middleware stack has not been built yet
+UnbuiltASGIApp = Tuple[
+    Union[HTTPRoute, WebSocketRoute, ASGIRoute], Union[HTTPRouteHandler, WebsocketRouteHandler, ASGIRouteHandler]
+]
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """
+    Splits a path into its non-empty components, prefixed with the root component '/'.
+
+    The result is cached, since the set of paths an app receives is usually small compared to the number of requests.
+    Components are not interned here, since this also runs on client supplied paths and interned strings may never
+    be freed - the trie keys are interned when routes are added instead.
+    """
+    return ("/", *filter(None, path.split("/")))
+
+
+class _RouteMapLeafData:
+    __slots__ = (
+        "asgi_handlers",
+        "dispatch",
+        "path_parameters",
+        "static_path",
+    )
+
+    def __init__(self, path_parameters: List[Dict[str, Any]]):
+        self.asgi_handlers: Dict[str, Union[ASGIApp, UnbuiltASGIApp]] = {}
+        # ASGI routes (including static files) receive every scope type, so they are dispatched to directly,
+        # otherwise the handler is looked up in asgi_handlers by http method or 'websocket'
+        self.dispatch: Union[ASGIApp, UnbuiltASGIApp, Dict[str, Union[ASGIApp, UnbuiltASGIApp]]] = self.asgi_handlers
+        self.path_parameters = path_parameters
+        self.static_path: Optional[str] = None
+
+
+class _RouteMapTree:
+    __slots__ = (
+        "children",
+        "data",
+        "param_child",
+    )
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _RouteMapTree] = {}
+        self.data: Optional[_RouteMapLeafData] = None
+        # the child standing in for a path parameter is kept out of children, so a literal '*' in a request path
+        # is parsed as a parameter value rather than matched as a component
+        self.param_child: Optional[_RouteMapTree] = None
+
+
+class RouteMap:
+    """
+    A trie of the app's routes, used by the ASGI router to resolve the ASGI app for each request.
+
+    Routes without path parameters are stored as plain routes and resolved with a single lookup, all other routes are
+    stored component by component in the children of each tree node, with a separate child per node standing in for a
+    path parameter.
+    """
+
+    __slots__ = (
+        "app",
+        "map",
+        "param_paths",
+        "path_parameters_cache",
+        "plain_routes",
+    )
+
+    def __init__(self, app: "Starlite"):
+        self.app = app
+        self.map = _RouteMapTree()
+        self.param_paths: Dict[str, str] = {}
+        # routes and leaves declaring the same path parameters share a single list, since it is never mutated once parsed
+        self.path_parameters_cache: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self.plain_routes: Dict[str, _RouteMapLeafData] = {}
+
+    def add_routes(self, routes: List[BaseRoute]) -> None:
+        """
+        Adds the given routes to the map.
+
+        The middleware stack of each route handler is only built once it receives its first request, see resolve_route.
+
+        Routes that replace an already added route with the same path (e.g. an HTTPRoute with additional handlers)
+        overwrite the handlers of the existing node.
+        """
+        for route in routes:
+            self.add_route_handlers(route=route, data=self.add_route_leaf(route))
+
+    def add_route_leaf(self, route: BaseRoute) -> _RouteMapLeafData:
+        """
+        Retrieves the leaf of the given route, inserting it into the trie or the plain routes if it does not exist yet.
+
+        Raises ImproperlyConfiguredException if the route's path parameters conflict with those of an existing route.
+        """
+        path = route.path
+        # the route is rebound to the shared list as well, so that its own copy can be freed
+        path_parameters = route.path_parameters = self.path_parameters_cache.setdefault(
+            tuple(param["full"] for param in route.path_parameters), route.path_parameters
+        )
+        if not route.path_parameters and path not in self.app.static_paths:
+            data = self.plain_routes.get(path)
+            if data is None:
+                data = self.plain_routes[path] = _RouteMapLeafData(path_parameters=path_parameters)
+            return data
+        if route.path_parameters:
+            path = param_match_regex.sub("*", path)
+        if self.param_paths.setdefault(path, route.path) != route.path:
+            raise ImproperlyConfiguredException("Should not use routes with conflicting path parameters")
+        cur = self.map
+        for component in _split_path(path):
+            if component == "*":
+                if cur.param_child is None:
+                    cur.param_child = _RouteMapTree()
+                cur = cur.param_child
+                continue
+            nxt = cur.children.get(component)
+            if nxt is None:
+                nxt = cur.children[sys.intern(component)] = _RouteMapTree()
+            cur = nxt
+        if cur.data is None:
+            cur.data = _RouteMapLeafData(path_parameters=path_parameters)
+        if path in self.app.static_paths:
+            cur.data.static_path = path
+        return cur.data
+
+    @staticmethod
+    def add_route_handlers(route: BaseRoute, data: _RouteMapLeafData) -> None:
+        """
+        Stores the unbuilt route handlers of the given route on its leaf, keyed by http method, 'websocket' or 'asgi'.
+        """
+        asgi_handlers = data.asgi_handlers
+        if isinstance(route, HTTPRoute):
+            # a route handler serving several http methods is stored as the same pair for each of them,
+            # so that resolve_route builds and shares a single middleware stack for all of them
+            unbuilt_handlers: Dict[int, UnbuiltASGIApp] = {}
+            for method, handler_mapping in route.route_handler_map.items():
+                handler, _ = handler_mapping
+                unbuilt_handler = unbuilt_handlers.get(id(handler))
+                if unbuilt_handler is None:
+                    unbuilt_handler = unbuilt_handlers[id(handler)] = (route, handler)
+                # methods are stored as interned plain strings - sys.intern rejects str subclasses, so HttpMethod
+                # members are unwrapped first
+                http_method = cast(Union[HttpMethod, str], method)
+                key = sys.intern(http_method.value if isinstance(http_method, HttpMethod) else http_method)
+                asgi_handlers[key] = unbuilt_handler
+        elif isinstance(route, WebSocketRoute):
+            asgi_handlers[_WEBSOCKET] = (route, route.route_handler)
+        elif isinstance(route, ASGIRoute):
+            asgi_handlers[_ASGI] = (route, route.route_handler)
+        asgi_handler = asgi_handlers.get(_ASGI)
+        data.dispatch = asgi_handler if asgi_handler is not None else asgi_handlers
+
+    def traverse_route_map(self, path: str, scope: Scope) -> _RouteMapLeafData:
+        """
+        Traverses the trie and retrieves the correct node for the request url, setting the raw path params on the scope.
+
+        Raises NotFoundException if no correlating node is found
+        """
+        path_params: List[str] = []
+        cur = self.map
+        for component in _split_path(path):
+            nxt = cur.children.get(component)
+            if nxt is not None:
+                cur = nxt
+                continue
+            nxt = cur.param_child
+            if nxt is not None:
+                path_params.append(component)
+                cur = nxt
+                continue
+            if cur.data is not None and cur.data.static_path:
+                # the remainder of the path is resolved by the static files app, relative to the static path
+                static_path = cur.data.static_path
+                if static_path != "/":
+                    scope_path: str = scope["path"]
+                    if scope_path.startswith(static_path):
+                        prefix_length = len(static_path)
+                        scope["path"] = scope_path[prefix_length:]
+                break
+            raise NotFoundException()
+        data = cur.data
+        if data is None:
+            raise NotFoundException()
+        scope["path_params"] = parse_path_params(data.path_parameters, path_params) if data.path_parameters else {}
+        return data
+
+    def lookup_route(self, scope: Scope) -> Tuple[_RouteMapLeafData, Union[ASGIApp, UnbuiltASGIApp]]:
+        """
+        Given a scope, retrieves the leaf of the route and its ASGI app or unbuilt route handler, and sets the parsed
+        path params on the scope.
+
+        Raises NotFoundException or MethodNotAllowedException if the scope cannot be resolved.
+        """
+        path: str = scope["path"]
+        if path != "/" and path.endswith("/"):
+            path = path.rstrip("/")
+        data = self.plain_routes.get(path)
+        if data is not None:
+            scope["path_params"] = {}
+        elif not self.map.children:
+            # no routes with path parameters or static paths are registered, hence there is nothing to traverse -
+            # this also keeps unknown paths from filling up the split path cache
+            raise NotFoundException()
+        else:
+            data = self.traverse_route_map(path=path, scope=scope)
+        dispatch = data.dispatch
+        if not isinstance(dispatch, dict):
+            return data, dispatch
+        if scope["type"] == _HTTP:
+            asgi_handler = dispatch.get(scope["method"])
+            if asgi_handler is None:
+                raise MethodNotAllowedException()
+            return data, asgi_handler
+        try:
+            return data, dispatch[_WEBSOCKET]
+        except KeyError as e:
+            raise NotFoundException() from e
+
+    def build_route(self, data: _RouteMapLeafData, unbuilt_handler: UnbuiltASGIApp) -> ASGIApp:
+        """
+        Builds the middleware stack of the given route handler and stores it on the leaf, replacing every entry that
+        shares the unbuilt route handler.
+        """
+        asgi_handler = self.app.build_route_middleware_stack(*unbuilt_handler)
+        asgi_handlers = data.asgi_handlers
+        for handler_key, value in asgi_handlers.items():
+            if value is unbuilt_handler:
+                asgi_handlers[handler_key] = asgi_handler
+        if data.dispatch is unbuilt_handler:
+            data.dispatch = asgi_handler
+        return asgi_handler
+
+    def resolve_route(self, scope: Scope) -> ASGIApp:
+        """
+        Given a scope, retrieves the correct ASGI App for the route and sets the parsed path params on the scope.
+
+        If the route handler's middleware stack has not been built yet, it is built and stored for subsequent requests.
+        The build happens after the lookup, so that errors raised while constructing middleware are not mistaken for a
+        missing route.
+
+        Raises NotFoundException or MethodNotAllowedException if the scope cannot be resolved.
+        """
+        data, asgi_handler = self.lookup_route(scope)
+        if isinstance(asgi_handler, tuple):
+            return self.build_route(data, asgi_handler)
+        return asgi_handler
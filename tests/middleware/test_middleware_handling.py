@@ -15,6 +15,9 @@ from typing_extensions import Type
 from starlite import (
     Controller,
     CORSConfig,
+    HttpMethod,
+    HTTPRoute,
+    ImproperlyConfiguredException,
     MiddlewareProtocol,
     Request,
     Response,
@@ -23,7 +26,9 @@ from starlite import (
     get,
     post,
 )
+from starlite import route as route_decorator
 from starlite.config import GZIPConfig
+from starlite.middleware import ExceptionHandlerMiddleware
 from starlite.testing import create_test_client
 
 logger = logging.getLogger(__name__)
@@ -61,6 +66,17 @@ class CustomHeaderMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class CountingMiddleware(MiddlewareProtocol):
+    instances: List["CountingMiddleware"] = []
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.instances.append(self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
 @pytest.mark.parametrize(
     "middleware",
     [
@@ -132,6 +148,11 @@ def test_trusted_hosts_middleware() -> None:
     assert trusted_hosts_middleware.allowed_hosts == ["*"]
 
 
+def test_trusted_hosts_validation() -> None:
+    with pytest.raises(ImproperlyConfiguredException):
+        Starlite(route_handlers=[handler], allowed_hosts=[1])  # type: ignore[list-item]
+
+
 def test_gzip_middleware() -> None:
     client = create_test_client(route_handlers=[handler], gzip_config=GZIPConfig())
     unpacked_middleware = []
@@ -193,3 +214,60 @@ def test_middleware_call_order() -> None:
         client.get("/router/controller/handler")
 
         assert results == [0, 1, 2, 3, 4, 5, 6, 7]
+
+
+def test_middleware_stack_is_built_once_on_first_request() -> None:
+    CountingMiddleware.instances.clear()
+
+    @get(path="/")
+    def counted_handler() -> None:
+        ...
+
+    with create_test_client(route_handlers=[counted_handler], middleware=[CountingMiddleware]) as client:
+        assert not CountingMiddleware.instances
+        assert client.get("/").status_code == 200
+        assert client.get("/").status_code == 200
+        assert len(CountingMiddleware.instances) == 1
+
+
+def test_route_without_middleware_is_wrapped_in_a_single_exception_handler() -> None:
+    @get(path="/")
+    def handler_without_middleware() -> None:
+        ...
+
+    app = Starlite(route_handlers=[handler_without_middleware], openapi_config=None)
+    route = cast(HTTPRoute, app.routes[0])
+    asgi_handler = app.build_route_middleware_stack(route, handler_without_middleware)
+    assert isinstance(asgi_handler, ExceptionHandlerMiddleware)
+    assert asgi_handler.app == route.handle
+
+
+def test_middleware_stack_is_shared_between_http_methods_of_a_handler() -> None:
+    CountingMiddleware.instances.clear()
+
+    @route_decorator(path="/", http_method=[HttpMethod.GET, HttpMethod.POST], status_code=200)
+    def multi_method_handler() -> None:
+        ...
+
+    with create_test_client(route_handlers=[multi_method_handler], middleware=[CountingMiddleware]) as client:
+        assert client.get("/").status_code == 200
+        assert client.post("/").status_code == 200
+        assert len(CountingMiddleware.instances) == 1
+
+
+def test_middleware_failing_to_construct_is_not_reported_as_missing_route() -> None:
+    class FailingMiddleware(MiddlewareProtocol):
+        def __init__(self, app: ASGIApp):
+            raise KeyError("missing setting")
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # pragma: no cover
+            ...
+
+    @get(path="/")
+    def handler_with_failing_middleware() -> None:
+        ...
+
+    with create_test_client(route_handlers=[handler_with_failing_middleware], middleware=[FailingMiddleware]) as client:
+        response = client.get("/")
+        assert response.status_code == 500
+        assert "missing setting" in response.text
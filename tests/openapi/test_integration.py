@@ -3,9 +3,10 @@ from openapi_schema_pydantic.util import construct_open_api_with_schema_class
 from orjson import loads
 from starlette.status import HTTP_200_OK
 
+from starlite import ResponseHeader, Starlite
 from starlite.app import DEFAULT_OPENAPI_CONFIG
 from starlite.enums import OpenAPIMediaType
-from starlite.testing import create_test_client
+from starlite.testing import TestClient, create_test_client
 from tests.openapi.utils import PersonController, PetController
 
 
@@ -33,3 +34,26 @@ def test_openapi_json() -> None:
         assert response.json() == loads(
             construct_open_api_with_schema_class(client.app.openapi_schema).json(by_alias=True, exclude_none=True)
         )
+
+
+def test_openapi_schema_is_rendered_once() -> None:
+    with create_test_client([PersonController, PetController], openapi_config=DEFAULT_OPENAPI_CONFIG) as client:
+        assert client.app.openapi_schema
+        first_json_response = client.get("/schema/openapi.json")
+        first_yaml_response = client.get("/schema/openapi.yaml")
+        client.app.openapi_schema.info.title = "changed"
+        assert client.get("/schema/openapi.json").content == first_json_response.content
+        assert client.get("/schema/openapi.yaml").content == first_yaml_response.content
+
+
+def test_openapi_schema_response_uses_layered_response_headers() -> None:
+    app = Starlite(
+        route_handlers=[PersonController, PetController],
+        openapi_config=DEFAULT_OPENAPI_CONFIG,
+        response_headers={"x-app": ResponseHeader(value="1")},
+    )
+    with TestClient(app=app) as client:
+        for path in ("/schema/openapi.json", "/schema/openapi.yaml"):
+            response = client.get(path)
+            assert response.status_code == HTTP_200_OK
+            assert response.headers["x-app"] == "1"
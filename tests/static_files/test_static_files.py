@@ -34,3 +34,12 @@ def test_config_validation(tmpdir: Any) -> None:
 
     with pytest.raises(ValidationError):
         StaticFilesConfig(path="", directories=[tmpdir])
+
+
+def test_staticfiles_with_static_path_in_file_path(tmpdir: Any) -> None:
+    tmpdir.mkdir("static").join("test.txt").write("content")
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmpdir])
+    with create_test_client([], static_files_config=static_files_config) as client:
+        response = client.get("/static/static/test.txt")
+        assert response.status_code == 200
+        assert response.text == "content"
@@ -5,6 +5,7 @@ from starlette.status import HTTP_400_BAD_REQUEST
 
 from starlite import (
     Controller,
+    ImproperlyConfiguredException,
     InternalServerException,
     MediaType,
     NotFoundException,
@@ -12,6 +13,7 @@ from starlite import (
     Response,
     Router,
     ServiceUnavailableException,
+    Starlite,
     ValidationException,
     get,
 )
@@ -73,3 +75,34 @@ def test_exception_handling(exc_to_raise: Exception, expected_layer: str) -> Non
     with create_test_client(route_handlers=[my_router]) as client:
         client.get("/base/test/")
         assert caller["name"] == expected_layer
+
+
+def test_app_exception_handlers_keys_validation() -> None:
+    def handler(request: Request, exc: Exception) -> Response:
+        return Response(content=None, status_code=500, media_type=MediaType.TEXT)
+
+    with pytest.raises(ImproperlyConfiguredException):
+        Starlite(route_handlers=[], exception_handlers={"500": handler})  # type: ignore[dict-item]
+
+
+def test_exception_raised_by_layered_exception_handler_is_handled_by_the_same_layers() -> None:
+    def reraise_handler(request: Request, exc: Exception) -> Response:
+        raise ServiceUnavailableException()
+
+    def service_unavailable_handler(request: Request, exc: Exception) -> Response:
+        return Response(content="handled by router", status_code=HTTP_400_BAD_REQUEST, media_type=MediaType.TEXT)
+
+    @get("/")
+    def handler_raising_value_error() -> None:
+        raise ValueError()
+
+    my_router = Router(
+        path="/base",
+        route_handlers=[handler_raising_value_error],
+        exception_handlers={ValueError: reraise_handler, ServiceUnavailableException: service_unavailable_handler},
+    )
+
+    with create_test_client(route_handlers=[my_router]) as client:
+        response = client.get("/base/")
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.text == "handled by router"
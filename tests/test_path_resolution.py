@@ -16,9 +16,11 @@ from starlite import (
     HTTPRouteHandler,
     ImproperlyConfiguredException,
     MediaType,
+    WebSocket,
     delete,
     get,
     post,
+    websocket,
 )
 from starlite.testing import create_test_client
 from tests import Person, PersonFactory
@@ -135,6 +137,7 @@ def test_handler_multi_paths() -> None:
         ("/sub-path", "/", HTTP_404_NOT_FOUND),
         ("/sub/path", "/sub-path", HTTP_404_NOT_FOUND),
         ("/sub/path", "/sub", HTTP_404_NOT_FOUND),
+        ("/sub/path", "/sub/path%20", HTTP_404_NOT_FOUND),
         ("/sub/path/{path_param:int}", "/sub/path", HTTP_404_NOT_FOUND),
         ("/sub/path/{path_param:int}", "/sub/path/abcd", HTTP_400_BAD_REQUEST),
         ("/sub/path/{path_param:uuid}", "/sub/path/100", HTTP_400_BAD_REQUEST),
@@ -187,3 +190,83 @@ def test_conflicting_paths() -> None:
 
     with pytest.raises(ImproperlyConfiguredException):
         create_test_client(handler_fn)
+
+
+def test_registering_handlers_on_existing_path_with_path_params() -> None:
+    @get(path="/items/{item_id:int}", media_type=MediaType.TEXT)
+    def get_handler(item_id: int) -> str:
+        return str(item_id)
+
+    @post(path="/items/{item_id:int}", media_type=MediaType.TEXT)
+    def post_handler(item_id: int) -> str:
+        return str(item_id * 2)
+
+    with create_test_client(get_handler) as client:
+        client.app.register(post_handler)
+        get_response = client.get("/items/2")
+        assert get_response.status_code == HTTP_200_OK
+        assert get_response.text == "2"
+        post_response = client.post("/items/2")
+        assert post_response.text == "4"
+
+
+def test_http_and_websocket_handlers_on_the_same_path() -> None:
+    @get(path="/items/{item_id:int}", media_type=MediaType.TEXT)
+    def http_handler(item_id: int) -> str:
+        return str(item_id)
+
+    @websocket(path="/items/{item_id:int}")
+    async def websocket_handler(socket: WebSocket, item_id: int) -> None:
+        await socket.accept()
+        await socket.send_json({"item_id": item_id})
+        await socket.close()
+
+    with create_test_client([http_handler, websocket_handler]) as client:
+        response = client.get("/items/1")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "1"
+        with client.websocket_connect("/items/2") as ws:
+            assert ws.receive_json() == {"item_id": 2}
+
+
+def test_path_parameter_names_containing_other_parameter_names() -> None:
+    @get(path="/{a:int}/{ba:int}", media_type=MediaType.TEXT)
+    def handler_fn(a: int, ba: int) -> str:
+        return f"{a}-{ba}"
+
+    with create_test_client(handler_fn) as client:
+        response = client.get("/1/2")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "1-2"
+
+
+def test_asterisk_component_is_parsed_as_path_parameter() -> None:
+    @get(path="/items/{item_id:str}", media_type=MediaType.TEXT)
+    def handler_fn(item_id: str) -> str:
+        return item_id
+
+    with create_test_client(handler_fn) as client:
+        response = client.get("/items/*")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "*"
+
+
+def test_routes_with_the_same_path_parameters_share_them() -> None:
+    @get(path="/users/{user_id:int}", media_type=MediaType.TEXT)
+    def user_handler(user_id: int) -> str:
+        return f"user-{user_id}"
+
+    @get(path="/groups/{user_id:int}", media_type=MediaType.TEXT)
+    def group_handler(user_id: int) -> str:
+        return f"group-{user_id}"
+
+    with create_test_client([user_handler, group_handler]) as client:
+        route_map = client.app.route_map
+        user_leaf = route_map.map.children["/"].children["users"].param_child.data  # type: ignore
+        group_leaf = route_map.map.children["/"].children["groups"].param_child.data  # type: ignore
+        assert user_leaf and group_leaf
+        assert user_leaf.path_parameters is group_leaf.path_parameters
+        user_route, group_route = client.app.routes[:2]
+        assert user_route.path_parameters is group_route.path_parameters is user_leaf.path_parameters
+        assert client.get("/users/1").text == "user-1"
+        assert client.get("/groups/2").text == "group-2"